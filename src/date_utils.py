@@ -11,6 +11,8 @@ __all__ = ["journal_date"]
 DEFAULT_TZ = ZoneInfo("Europe/London")
 DEFAULT_CUTOFF = time(4, 0)  # 04:00
 
+_UTC = ZoneInfo("UTC")
+
 
 def journal_date(
     message_dt_utc: datetime,
@@ -38,9 +40,9 @@ def journal_date(
 
     # Ensure we are working with an aware UTC datetime
     if message_dt_utc.tzinfo is None:
-        message_dt_utc = message_dt_utc.replace(tzinfo=ZoneInfo("UTC"))
-    else:
-        message_dt_utc = message_dt_utc.astimezone(ZoneInfo("UTC"))
+        message_dt_utc = message_dt_utc.replace(tzinfo=_UTC)
+    elif message_dt_utc.tzinfo is not _UTC:
+        message_dt_utc = message_dt_utc.astimezone(_UTC)
 
     # Convert to local timezone
     local_dt = message_dt_utc.astimezone(tz)
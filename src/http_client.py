@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+"""Shared httpx client configuration for the OpenAI and Notion integrations.
+
+Each integration gets its own client instance — the Notion SDK mutates the
+client it is handed (base URL, auth headers), so a single instance cannot be
+shared across services, and HTTP/2 multiplexing only applies per origin
+anyway. Building them here with one keep-alive, HTTP/2 configuration means
+repeated API calls reuse a warm TCP+TLS connection per origin instead of
+paying a fresh handshake each time, and concurrent requests to the same host
+multiplex over one connection.
+"""
+
+import atexit
+
+import httpx
+
+# Sized for bursty load: enough warm keep-alive connections that concurrent
+# pipelines never wait on a TLS handshake, with headroom above that for spikes.
+_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# Generous read timeout for long Whisper/GPT calls, but fail fast on connect.
+_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+
+
+def new_http_client(**kwargs) -> httpx.Client:
+    """Return a pooled, HTTP/2-enabled sync client, closed automatically at exit."""
+    kwargs.setdefault("timeout", _TIMEOUT)
+    client = httpx.Client(http2=True, limits=_LIMITS, **kwargs)
+    atexit.register(client.close)
+    return client
+
+
+def new_async_http_client(**kwargs) -> httpx.AsyncClient:
+    """Return a pooled, HTTP/2-enabled async client."""
+    kwargs.setdefault("timeout", _TIMEOUT)
+    return httpx.AsyncClient(http2=True, limits=_LIMITS, **kwargs)
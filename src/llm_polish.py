@@ -6,38 +6,141 @@ and produces clean prose while retaining meaning and voice.
 """
 
 import argparse
+import asyncio
+import hashlib
+import io
 import os
+import re
+import threading
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Iterator, Optional
 
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+from src.http_client import new_async_http_client, new_http_client
+
+
+def _loads_json(data: "str | bytes") -> Any:
+    """Parse JSON (orjson when available — 3-10x faster than stdlib)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+# max_retries=4: the SDK retries 429s, connection errors and 5xx responses
+# itself with exponential backoff, so a transient blip doesn't abort the
+# pipeline (and force the user to resend) after transcription already ran.
+client = AsyncOpenAI(
+    api_key=OPENAI_API_KEY, http_client=new_async_http_client(), max_retries=4
+)
+# Sync client for the streaming path (the pipeline consumes it from a worker thread)
+_stream_client = OpenAI(
+    api_key=OPENAI_API_KEY, http_client=new_http_client(), max_retries=4
+)
 
+# 'summary' is requested *first* so that streamed responses deliver it within
+# the first few tokens — downstream code can start creating the Notion page
+# while the (much longer) 'polished' string is still being generated.
 JSON_PROMPT = (
     "You are a helpful assistant that receives a raw speech transcript. "
-    "Return a JSON object with **exactly two keys**:\n"
-    "1. 'polished'  – a *single string* containing the polished transcript in first-person voice. Use blank lines to separate paragraphs. Keep meaning; don't add new content.\n"
-    "2. 'summary'   – a single short phrase (≈3-8 words, no verbs like 'reflecting/thinking') that names the *specific* key event(s) or thought(s). Examples: 'Applied for ILR and built a bot', 'Leaving job; starting open-source work'.\n"
+    "Return a JSON object with **exactly two keys, in this order**:\n"
+    "1. 'summary'   – a single short phrase (≈3-8 words, no verbs like 'reflecting/thinking') that names the *specific* key event(s) or thought(s). Examples: 'Applied for ILR and built a bot', 'Leaving job; starting open-source work'.\n"
+    "2. 'polished'  – a *single string* containing the polished transcript in first-person voice. Use blank lines to separate paragraphs. Keep meaning; don't add new content.\n"
     "Respond with valid JSON only, no markdown fences or extra keys."
 )
 
+# Matches a completed "summary" string value inside a partial JSON buffer
+_SUMMARY_RE = re.compile(r'"summary"\s*:\s*"((?:[^"\\]|\\.)*)"')
 
-def process_transcript(
+
+# ----------------------------------------------------------------------
+# Response cache: identical (model, temperature, prompt, text) requests hit
+# the local cache instead of paying the full OpenAI round-trip. Useful for
+# retries, resent audio, and dev iteration on the same transcript.
+# ----------------------------------------------------------------------
+
+CACHE_PATH = Path.home() / ".cache" / "audio-journal" / "llm_cache.json"
+
+# Oldest entries are evicted past this point, keeping the cache file (and the
+# rewrite on every miss) bounded instead of growing with the full history.
+CACHE_MAX_ENTRIES = 256
+
+cache_stats = {"hits": 0, "misses": 0}
+
+_cache: Optional[dict[str, dict[str, str]]] = None  # loaded lazily
+# Pipelines run on several worker threads; the dict and its file rewrite
+# must not race (same reason the Notion sqlite caches take a lock).
+_cache_lock = threading.Lock()
+
+
+def _cache_key(model: str, temperature: float, text: str) -> str:
+    payload = json.dumps(
+        {"model": model, "temp": temperature, "sys": JSON_PROMPT, "text": text},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_get(key: str) -> Optional[dict[str, str]]:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            try:
+                _cache = _loads_json(CACHE_PATH.read_bytes())
+            except (FileNotFoundError, ValueError):
+                _cache = {}
+        value = _cache.get(key)
+        if value is not None:
+            # Refresh recency (dict preserves insertion order) so eviction
+            # drops the least recently used entry.
+            _cache[key] = _cache.pop(key)
+        return value
+
+
+def _cache_put(key: str, value: dict[str, str]) -> None:
+    assert _cache is not None  # _cache_get always runs first
+    with _cache_lock:
+        _cache[key] = value
+        while len(_cache) > CACHE_MAX_ENTRIES:
+            _cache.pop(next(iter(_cache)))
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            CACHE_PATH.write_bytes(orjson.dumps(_cache))
+        else:
+            CACHE_PATH.write_text(
+                json.dumps(_cache, ensure_ascii=False), encoding="utf-8"
+            )
+
+
+async def process_transcript_async(
     text: str,
     *,
     model: str = "gpt-4o-mini",
     temperature: float = 0.3,
     max_tokens: Optional[int] = None,
+    cache_enabled: bool = True,
 ) -> dict[str, str]:
-    """Return a dict with 'polished' text and 'keyword' theme extracted by the LLM."""
+    """Return a dict with 'polished' text and 'summary' theme extracted by the LLM."""
 
-    response = client.chat.completions.create(
+    if cache_enabled:
+        key = _cache_key(model, temperature, text)
+        cached = _cache_get(key)
+        if cached is not None:
+            cache_stats["hits"] += 1
+            return cached
+        cache_stats["misses"] += 1
+
+    response = await client.chat.completions.create(
         model=model,
         messages=[
             {"role": "system", "content": JSON_PROMPT},
@@ -49,7 +152,248 @@ def process_transcript(
     )
 
     content = response.choices[0].message.content.strip()
-    return json.loads(content)
+    result = _loads_json(content)
+
+    if cache_enabled:
+        _cache_put(key, result)
+
+    return result
+
+
+def process_transcript(
+    text: str,
+    *,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    cache_enabled: bool = True,
+) -> dict[str, str]:
+    """Synchronous wrapper around :func:`process_transcript_async` for CLI and thread-pool callers."""
+
+    return asyncio.run(
+        process_transcript_async(
+            text,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            cache_enabled=cache_enabled,
+        )
+    )
+
+
+async def polish_many(
+    texts: list[str],
+    *,
+    max_concurrent: int = 5,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+) -> list[dict[str, str]]:
+    """Polish several transcripts concurrently, bounded by *max_concurrent*.
+
+    The OpenAI calls are pure network I/O, so overlapping them means N
+    transcripts finish in roughly the latency of the slowest one instead of
+    the sum. The semaphore keeps us under API rate limits.
+    """
+
+    semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def _one(text: str) -> dict[str, str]:
+        async with semaphore:
+            return await process_transcript_async(
+                text, model=model, temperature=temperature
+            )
+
+    return await asyncio.gather(*(_one(text) for text in texts))
+
+
+def process_transcripts_batch(
+    texts: list[str],
+    *,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+    completion_window: str = "24h",
+    poll_interval: float = 30.0,
+) -> list[dict[str, str]]:
+    """Polish many transcripts through the OpenAI Batch API.
+
+    Meant for deferred bulk processing (e.g. an end-of-day flush) rather than
+    the interactive pipeline: batched requests cost half the synchronous
+    price and get higher throughput, in exchange for latency of up to
+    *completion_window*. Blocks while polling the job every *poll_interval*
+    seconds and returns results in input order.
+    """
+
+    if not texts:
+        return []
+
+    lines = [
+        json.dumps(
+            {
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": model,
+                    "messages": [
+                        {"role": "system", "content": JSON_PROMPT},
+                        {"role": "user", "content": text},
+                    ],
+                    "temperature": temperature,
+                    "response_format": {"type": "json_object"},
+                },
+            },
+            ensure_ascii=False,
+        )
+        for i, text in enumerate(texts)
+    ]
+    payload = io.BytesIO("\n".join(lines).encode("utf-8"))
+
+    input_file = _stream_client.files.create(
+        file=("transcripts_batch.jsonl", payload), purpose="batch"
+    )
+    batch = _stream_client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window=completion_window,
+    )
+
+    while batch.status not in ("completed", "failed", "expired", "cancelled"):
+        time.sleep(poll_interval)
+        batch = _stream_client.batches.retrieve(batch.id)
+
+    if batch.status != "completed":
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    output = _stream_client.files.content(batch.output_file_id)
+    results: list[Optional[dict[str, str]]] = [None] * len(texts)
+    for line in output.text.splitlines():
+        if not line.strip():
+            continue
+        record = _loads_json(line)
+        content = record["response"]["body"]["choices"][0]["message"]["content"]
+        results[int(record["custom_id"])] = _loads_json(content.strip())
+
+    missing = [i for i, r in enumerate(results) if r is None]
+    if missing:
+        raise RuntimeError(f"Batch {batch.id} returned no result for inputs {missing}")
+
+    return results  # type: ignore[return-value]
+
+
+def process_transcript_stream(
+    text: str,
+    *,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    cache_enabled: bool = True,
+) -> Iterator[tuple[str, Any]]:
+    """Stream the polish request, yielding events as fields become available.
+
+    Yields ``("summary", str)`` as soon as the summary value is complete in
+    the token stream (the prompt asks for it first, so this typically happens
+    within the first few tokens), followed by ``("result", dict)`` with the
+    full parsed response. Callers can start Notion page creation on the
+    summary event while the polished text is still streaming.
+    """
+
+    if cache_enabled:
+        key = _cache_key(model, temperature, text)
+        cached = _cache_get(key)
+        if cached is not None:
+            cache_stats["hits"] += 1
+            if cached.get("summary"):
+                yield ("summary", cached["summary"])
+            yield ("result", cached)
+            return
+        cache_stats["misses"] += 1
+
+    stream = _stream_client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": JSON_PROMPT},
+            {"role": "user", "content": text},
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+        stream=True,
+    )
+
+    buf: list[str] = []
+    summary_emitted = False
+    for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        buf.append(delta)
+        if not summary_emitted:
+            match = _SUMMARY_RE.search("".join(buf))
+            if match:
+                # Decode JSON string escapes (e.g. \" or \n) properly
+                yield ("summary", json.loads(f'"{match.group(1)}"'))
+                summary_emitted = True
+
+    result = _loads_json("".join(buf).strip())
+
+    if cache_enabled:
+        _cache_put(key, result)
+
+    yield ("result", result)
+
+
+async def process_transcript_stream_async(
+    text: str,
+    *,
+    model: str = "gpt-4o-mini",
+    temperature: float = 0.3,
+    max_tokens: Optional[int] = None,
+    cache_enabled: bool = True,
+) -> AsyncIterator[tuple[str, Any]]:
+    """Async counterpart of :func:`process_transcript_stream` (same events)."""
+
+    if cache_enabled:
+        key = _cache_key(model, temperature, text)
+        cached = _cache_get(key)
+        if cached is not None:
+            cache_stats["hits"] += 1
+            if cached.get("summary"):
+                yield ("summary", cached["summary"])
+            yield ("result", cached)
+            return
+        cache_stats["misses"] += 1
+
+    stream = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": JSON_PROMPT},
+            {"role": "user", "content": text},
+        ],
+        temperature=temperature,
+        max_tokens=max_tokens,
+        response_format={"type": "json_object"},
+        stream=True,
+    )
+
+    buf: list[str] = []
+    summary_emitted = False
+    async for chunk in stream:
+        delta = chunk.choices[0].delta.content if chunk.choices else None
+        if not delta:
+            continue
+        buf.append(delta)
+        if not summary_emitted:
+            match = _SUMMARY_RE.search("".join(buf))
+            if match:
+                yield ("summary", json.loads(f'"{match.group(1)}"'))
+                summary_emitted = True
+
+    result = _loads_json("".join(buf).strip())
+
+    if cache_enabled:
+        _cache_put(key, result)
+
+    yield ("result", result)
 
 
 def main() -> None:
@@ -9,18 +9,39 @@ Assumes the target database has the following properties:
 - Structured (rich_text): polished transcript text
 """
 
+import hashlib
 import os
+import re
+import sqlite3
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
+from itertools import chain, islice
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+import httpx
 from dotenv import load_dotenv
 from notion_client import Client
+from notion_client.errors import APIErrorCode, APIResponseError, HTTPResponseError
+from tenacity import (
+    retry,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 
 # Local utilities
-from src.text_utils import chunk_text
+from src.http_client import new_http_client
+from src.text_utils import chunk_text, iter_chunks
 from src.date_utils import journal_date as _journal_date
 
 load_dotenv()
@@ -29,12 +50,233 @@ NOTION_DATABASE_ID = os.getenv("NOTION_DATABASE_ID")
 if NOTION_API_KEY is None or NOTION_DATABASE_ID is None:
     raise RuntimeError("NOTION_API_KEY and NOTION_TEST_DATABASE_ID must be set in .env")
 
-client = Client(auth=NOTION_API_KEY)
+client = Client(auth=NOTION_API_KEY, client=new_http_client())
 
 # Notion rich-text limit; stay comfortably below 2000 characters.
 MAX_CHARS = 1800
-# Batch size for appending children blocks to a page (Notion limit is 100 per request)
-CHILD_BATCH_SIZE = 50
+# Children per append request — the documented API maximum.
+# https://developers.notion.com/reference/patch-block-children
+CHILD_BATCH_SIZE = 100
+# Shared pool for background artifact writes — reused across entries instead
+# of spinning up a fresh pool per call.
+_artifact_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="artifacts")
+
+# ----------------------------------
+# Retry policy + idempotency cache
+# ----------------------------------
+
+class _TokenBucket:
+    """Minimal thread-safe token bucket used to throttle Notion requests."""
+
+    def __init__(self, rate: float, capacity: float):
+        self._rate = rate  # tokens added per second
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+# ~2.5 req/s, just under Notion's published 3 req/s limit; keeps concurrent
+# appends and parallel pipelines from triggering 429/502 cascades.
+_notion_bucket = _TokenBucket(rate=2.5, capacity=3)
+
+
+# Notion error codes worth retrying: transient server faults and rate limits.
+_RETRYABLE_CODES = (
+    APIErrorCode.RateLimited,
+    APIErrorCode.InternalServerError,
+    APIErrorCode.ServiceUnavailable,
+    APIErrorCode.ConflictError,
+)
+
+
+def _is_retryable_error(exc: BaseException) -> bool:
+    if isinstance(exc, APIResponseError):
+        return exc.code in _RETRYABLE_CODES
+    # Non-API-coded 5xx and transport-level failures (timeouts, resets)
+    return isinstance(exc, (HTTPResponseError, httpx.TransportError))
+
+
+# Jittered so concurrent append workers don't retry in lockstep
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _notion_wait(retry_state) -> float:
+    """Honour a 429's Retry-After header; exponential backoff otherwise."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(exc, APIResponseError) and exc.code == APIErrorCode.RateLimited:
+        # notion-client stores the response headers directly on the error
+        retry_after = exc.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return _backoff(retry_state)
+
+
+_notion_retry = retry(
+    stop=stop_after_attempt(5),
+    wait=_notion_wait,
+    retry=retry_if_exception(_is_retryable_error),
+    reraise=True,
+)
+
+
+@_notion_retry
+def _pages_create(**kwargs: Any) -> dict[str, Any]:
+    _notion_bucket.acquire()
+    return client.pages.create(**kwargs)
+
+
+@_notion_retry
+def _pages_update(**kwargs: Any) -> dict[str, Any]:
+    _notion_bucket.acquire()
+    return client.pages.update(**kwargs)
+
+
+@_notion_retry
+def _blocks_append(**kwargs: Any) -> dict[str, Any]:
+    _notion_bucket.acquire()
+    return client.blocks.children.append(**kwargs)
+
+
+# Content-hash → created-page cache, so a pipeline retry after a transient
+# failure returns the already-created page instead of making a duplicate.
+PAGE_CACHE_PATH = Path.home() / ".cache" / "audio-journal" / "notion_pages.sqlite"
+PAGE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+_page_cache_lock = threading.Lock()
+_page_cache_conn: sqlite3.Connection | None = None
+
+
+def _page_cache() -> sqlite3.Connection:
+    global _page_cache_conn
+    if _page_cache_conn is None:
+        PAGE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(PAGE_CACHE_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages "
+            "(key TEXT PRIMARY KEY, page_id TEXT, page_url TEXT, ts INTEGER)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, page_id TEXT, page_url TEXT, "
+            "entry_dir TEXT, ts INTEGER)"
+        )
+        conn.commit()
+        _page_cache_conn = conn
+    return _page_cache_conn
+
+
+def _entry_key(journal_date: date, keyword: str, structured: str) -> str:
+    return hashlib.sha256(
+        f"{journal_date.isoformat()}|{keyword}|{structured}".encode("utf-8")
+    ).hexdigest()
+
+
+def _cached_page(key: str) -> tuple[str, str] | None:
+    with _page_cache_lock:
+        row = _page_cache().execute(
+            "SELECT page_id, page_url FROM pages WHERE key = ? AND ts >= ?",
+            (key, int(time.time()) - PAGE_CACHE_TTL),
+        ).fetchone()
+    return row
+
+
+def _remember_page(key: str, page_id: str, page_url: str) -> None:
+    with _page_cache_lock:
+        conn = _page_cache()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO pages (key, page_id, page_url, ts) "
+                "VALUES (?, ?, ?, ?)",
+                (key, page_id, page_url, int(time.time())),
+            )
+
+
+def _message_key(message_dt: datetime, raw_transcript: str) -> str:
+    """Dedupe key for a delivered message: timestamp + raw transcript hash."""
+    return hashlib.sha1(
+        f"{message_dt.isoformat()}|{raw_transcript}".encode("utf-8")
+    ).hexdigest()
+
+
+def _cached_entry(key: str) -> tuple[str, str] | None:
+    """Return (page_url, entry_dir) for an already-processed message, if any."""
+    with _page_cache_lock:
+        row = _page_cache().execute(
+            "SELECT page_url, entry_dir FROM entries WHERE key = ? AND ts >= ?",
+            (key, int(time.time()) - PAGE_CACHE_TTL),
+        ).fetchone()
+    return row
+
+
+def _remember_entry(key: str, page_id: str, page_url: str, entry_dir: str) -> None:
+    with _page_cache_lock:
+        conn = _page_cache()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, page_id, page_url, entry_dir, ts) VALUES (?, ?, ?, ?, ?)",
+                (key, page_id, page_url, entry_dir, int(time.time())),
+            )
+
+
+# Matches the *_YYYYMMDD_HHMMSS suffix of transcript file stems.
+# Precompiled and parsed by integer groups — much cheaper than strptime
+# when pushing many files in bulk.
+_TS_RE = re.compile(r"_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})$")
+
+
+def _append_children(page_id: str, children: Iterable[dict[str, Any]]) -> None:
+    """Append *children* to a page in batches of ``CHILD_BATCH_SIZE``.
+
+    *children* may be any iterable (including a lazy block generator); it is
+    consumed one batch at a time, so only ``CHILD_BATCH_SIZE`` blocks are
+    ever materialised per request. Batches are sent sequentially: Notion
+    appends blocks in arrival order and the API has no cross-request ordering
+    anchor, so concurrent dispatch could interleave a long entry's
+    paragraphs. Entries needing more than one batch (>100 blocks) are rare,
+    so the extra round-trips are negligible.
+    """
+
+    blocks = iter(children)
+    while True:
+        batch = list(islice(blocks, CHILD_BATCH_SIZE))
+        if not batch:
+            return
+        _blocks_append(block_id=page_id, children=batch)
+
+
+def _dumps_json_bytes(obj: Any) -> bytes:
+    """Serialize *obj* to indented UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _loads_json(data: bytes) -> Any:
+    """Parse JSON from UTF-8 bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def _rich_text(text: str) -> list[dict[str, Any]]:
@@ -50,6 +292,46 @@ def _paragraph_block(text: str) -> dict[str, Any]:
     }
 
 
+def _paragraphs(chunks: list[str]) -> list[dict[str, Any]]:
+    """Return paragraph blocks for *chunks* in a single pass.
+
+    Inlines the block/rich-text structure instead of calling
+    ``_paragraph_block`` per chunk — long entries produce dozens of blocks,
+    and the dict literal halves the per-chunk allocations.
+    """
+    return [
+        {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {"rich_text": [{"type": "text", "text": {"content": c}}]},
+        }
+        for c in chunks
+    ]
+
+
+def build_notion_blocks(
+    text: str, max_chars: int = MAX_CHARS, *, skip_chunks: int = 0
+) -> Iterator[dict[str, Any]]:
+    """Yield paragraph blocks for *text*, one per chunk, lazily.
+
+    Fuses chunking and block construction: spans come straight from
+    ``iter_chunks`` and each block slices only its own chunk, so long
+    transcripts are never duplicated into an intermediate chunk list.
+    *skip_chunks* leading chunks can be skipped — used when the first chunk
+    is carried in a page property rather than a block.
+    """
+
+    spans = iter_chunks(text, max_chars)
+    for start, end in islice(spans, skip_chunks, None):
+        yield {
+            "object": "block",
+            "type": "paragraph",
+            "paragraph": {
+                "rich_text": [{"type": "text", "text": {"content": text[start:end]}}]
+            },
+        }
+
+
 def _heading_block(text: str) -> dict[str, Any]:
     return {
         "object": "block",
@@ -81,7 +363,7 @@ def create_journal_entry(
     if raw:
         props["Raw"] = {"rich_text": _rich_text(raw)}
 
-    response = client.pages.create(
+    response = _pages_create(
         parent={"database_id": NOTION_DATABASE_ID},
         properties=props,
     )
@@ -99,12 +381,27 @@ def _create_page_with_chunks(
     journal_date: date,
     structured_chunks: list[str],
     raw_first_chunk: str | None = None,
+    extra_children: Iterable[dict[str, Any]] | None = None,
 ) -> tuple[str, str]:
     """Create a page and append *structured_chunks* (paragraph blocks).
 
+    *extra_children* (e.g. the raw-transcript tail) are appended in the same
+    batched pass as the structured tail, so short entries pay one append
+    round-trip instead of two.
+
     Returns (page_id, page_url).
+
+    Creation is idempotent within ``PAGE_CACHE_TTL``: if an entry with the
+    same date, title and structured text was already created (e.g. a retry
+    after a transient failure further down the pipeline), the existing page
+    is returned instead of a duplicate being made.
     """
 
+    entry_key = _entry_key(journal_date, keyword, "".join(structured_chunks))
+    cached = _cached_page(entry_key)
+    if cached is not None:
+        return cached
+
     page = create_journal_entry(
         keyword=keyword,
         journal_date=journal_date,
@@ -114,14 +411,15 @@ def _create_page_with_chunks(
 
     page_id = page["id"]
 
-    # Append remaining structured chunks (if any)
-    children = [_paragraph_block(chunk) for chunk in structured_chunks[1:]]
+    # Remember the page before the appends: if an append fails, the retry
+    # must find this page rather than create a duplicate.
+    _remember_page(entry_key, page_id, page["url"])
 
-    for i in range(0, len(children), CHILD_BATCH_SIZE):
-        client.blocks.children.append(
-            block_id=page_id,
-            children=children[i : i + CHILD_BATCH_SIZE],
-        )
+    # Append remaining structured chunks (if any), plus any extra children
+    children: Iterable[dict[str, Any]] = _paragraphs(structured_chunks[1:])
+    if extra_children is not None:
+        children = chain(children, extra_children)
+    _append_children(page_id, children)
 
     return page_id, page["url"]
 
@@ -141,7 +439,7 @@ def push_from_files(
     Returns created page URL.
     """
 
-    processed_data = json.loads(Path(processed_json_path).read_text(encoding="utf-8"))
+    processed_data = _loads_json(Path(processed_json_path).read_bytes())
     # Accept 'summary' as primary, fallback to 'keyword'
     title_text = processed_data.get("summary") or "Untitled"
     structured_full = processed_data["polished"]
@@ -153,15 +451,13 @@ def push_from_files(
     if message_dt is None:
         # Try to extract timestamp from file name: *_YYYYMMDD_HHMMSS.txt
         stem = Path(raw_transcript_path).stem
-        parts = stem.split("_")
-        if len(parts) < 3:
+        match = _TS_RE.search(stem)
+        if match is None:
             raise ValueError("Could not parse timestamp from file name")
-        timestamp_part = "_".join(parts[-2:])  # e.g. 20250720_203049
         try:
-            dt = datetime.strptime(timestamp_part, "%Y%m%d_%H%M%S")
+            message_dt = datetime(*map(int, match.groups()))  # naive UTC
         except ValueError as e:
             raise ValueError("Filename timestamp format incorrect") from e
-        message_dt = dt.replace(tzinfo=None)  # naive UTC
 
     logical_date = _journal_date(message_dt)
 
@@ -193,9 +489,17 @@ def create_entry_from_memory(
         entry_id: Optional unique ID for this entry (will generate UUID if not provided)
 
     Returns:
-        tuple of (notion_page_url, entry_directory_path)
+        tuple of (notion_page_url, artifact_ref) — artifact_ref is the entry
+        directory in legacy file mode, or "journal.db:<entry_id>" otherwise
     """
 
+    # A resent/re-delivered message (same timestamp, same transcript) returns
+    # the already-created page instead of producing a duplicate.
+    dedupe_key = _message_key(message_dt, raw_transcript)
+    cached_entry = _cached_entry(dedupe_key)
+    if cached_entry is not None:
+        return cached_entry
+
     if entry_id is None:
         entry_id = str(uuid.uuid4())[:8]  # Short UUID for directory names
 
@@ -209,12 +513,21 @@ def create_entry_from_memory(
     # Determine journal date
     logical_date = _journal_date(message_dt)
 
-    # ----------------------------------------
-    # 1) Create Notion page with structured content
-    # ----------------------------------------
-
+    # First raw chunk goes into the Raw property; the rest stream out as
+    # "continued" blocks without ever materialising a full chunk list.
+    first_raw = next(iter_chunks(raw_transcript, MAX_CHARS), None)
     raw_first_chunk = (
-        chunk_text(raw_transcript, MAX_CHARS)[0] if raw_transcript else None
+        raw_transcript[first_raw[0] : first_raw[1]] if first_raw is not None else None
+    )
+
+    # ----------------------------------------------------------
+    # 1+2) Create Notion page; the structured tail and the raw
+    # transcript tail go out together in one batched append phase.
+    # The Notion-independent artifact work overlaps the network.
+    # ----------------------------------------------------------
+
+    artifact_ref, disk_future = _start_artifacts(
+        entry_id, message_dt, raw_transcript, polished_data
     )
 
     page_id, page_url = _create_page_with_chunks(
@@ -222,49 +535,364 @@ def create_entry_from_memory(
         journal_date=logical_date,
         structured_chunks=structured_chunks,
         raw_first_chunk=raw_first_chunk,
+        extra_children=_raw_tail_blocks(raw_transcript),
     )
 
-    # ------------------------------------------------
-    # 2) Append remaining chunks (raw transcript, etc.)
-    # ------------------------------------------------
-
-    children: list[dict[str, Any]] = []
-
-    # Add raw transcript chunks if there are multiple and if raw transcript exists
-    if raw_transcript:
-        raw_chunks = chunk_text(raw_transcript, MAX_CHARS)
-        if len(raw_chunks) > 1:
-            children.append(_heading_block("Raw Transcript (continued)"))
-            for chunk in raw_chunks[1:]:
-                children.append(_paragraph_block(chunk))
-
-    # Push children in batches
-    for i in range(0, len(children), CHILD_BATCH_SIZE):
-        client.blocks.children.append(
-            block_id=page_id,
-            children=children[i : i + CHILD_BATCH_SIZE],
-        )
-
     # ----------------------------------------
-    # 3) Save artifacts to organized directory
+    # 3) Finish artifacts (needs the page id/url)
     # ----------------------------------------
 
-    # Create unique directory for this entry
+    _finish_artifacts(
+        artifact_ref,
+        disk_future,
+        entry_id=entry_id,
+        message_dt=message_dt,
+        logical_date=logical_date,
+        raw_transcript=raw_transcript,
+        polished_data=polished_data,
+        title_text=title_text,
+        page_id=page_id,
+        page_url=page_url,
+    )
+
+    _remember_entry(dedupe_key, page_id, page_url, artifact_ref)
+
+    return page_url, artifact_ref
+
+
+def _stream_page(
+    key: str,
+    *,
+    keyword: str,
+    journal_date: date,
+    structured: str,
+    raw: str | None,
+) -> tuple[str, str]:
+    """Create the page for a streamed entry, or reuse it on a retry.
+
+    The page is recorded in the idempotency cache immediately after creation,
+    so if anything later in the stream path fails (update, appends), a retry
+    finds this page instead of leaving it orphaned and creating a duplicate.
+    """
+
+    cached = _cached_page(key)
+    if cached is not None:
+        return cached
+    page = create_journal_entry(
+        keyword=keyword,
+        journal_date=journal_date,
+        structured=structured,
+        raw=raw,
+    )
+    _remember_page(key, page["id"], page["url"])
+    return page["id"], page["url"]
+
+
+def create_entry_from_stream(
+    *,
+    raw_transcript: str,
+    events,
+    message_dt: datetime,
+    entry_id: str | None = None,
+) -> tuple[str, str, dict[str, str]]:
+    """Create a journal entry from a polish event stream, overlapping I/O.
+
+    *events* is an iterator of ``(kind, value)`` tuples as produced by
+    ``llm_polish.process_transcript_stream``. As soon as the ``"summary"``
+    event arrives, page creation starts in a background thread while the LLM
+    is still generating the polished text; the Structured property and
+    remaining blocks are filled in once the full result lands. This hides the
+    Notion page-creation round-trip behind the LLM generation tail.
+
+    Returns (notion_page_url, artifact_ref, polished_data).
+    """
+
+    # Duplicate delivery guard — never started, the events generator also
+    # skips its LLM call, so a resend costs nothing.
+    dedupe_key = _message_key(message_dt, raw_transcript)
+    cached_entry = _cached_entry(dedupe_key)
+    if cached_entry is not None:
+        page_url, artifact_ref = cached_entry
+        return page_url, artifact_ref, _load_polished(artifact_ref)
+
+    if entry_id is None:
+        entry_id = str(uuid.uuid4())[:8]
+
+    logical_date = _journal_date(message_dt)
+
+    # Page-cache key for this message's page; lets a retry after a mid-stream
+    # failure reuse the already-created page.
+    page_key = f"stream:{dedupe_key}"
+
+    first_raw = next(iter_chunks(raw_transcript, MAX_CHARS), None)
+    raw_first_chunk = (
+        raw_transcript[first_raw[0] : first_raw[1]] if first_raw is not None else None
+    )
+
+    page_future = None
+    polished_data: dict[str, str] | None = None
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for kind, value in events:
+            if kind == "summary" and page_future is None:
+                # Kick off page creation now; Structured is patched in later.
+                page_future = executor.submit(
+                    _stream_page,
+                    page_key,
+                    keyword=value,
+                    journal_date=logical_date,
+                    structured="",
+                    raw=raw_first_chunk,
+                )
+            elif kind == "result":
+                polished_data = value
+
+    if polished_data is None:
+        raise RuntimeError("Polish stream ended without a 'result' event")
+
+    title_text = polished_data.get("summary") or "Untitled"
+    structured_full = polished_data["polished"]
+    structured_chunks = chunk_text(structured_full, MAX_CHARS) or [""]
+
+    # Notion-independent artifact work overlaps the remaining update/append
+    # round-trips.
+    artifact_ref, disk_future = _start_artifacts(
+        entry_id, message_dt, raw_transcript, polished_data
+    )
+
+    if page_future is not None:
+        page_id, page_url = page_future.result()
+        _pages_update(
+            page_id=page_id,
+            properties={"Structured": {"rich_text": _rich_text(structured_chunks[0])}},
+        )
+    else:
+        # No early summary event (e.g. model ignored key order) — create the
+        # page the regular way (still keyed for retry reuse).
+        page_id, page_url = _stream_page(
+            page_key,
+            keyword=title_text,
+            journal_date=logical_date,
+            structured=structured_chunks[0],
+            raw=raw_first_chunk,
+        )
+
+    _append_children(
+        page_id,
+        chain(_paragraphs(structured_chunks[1:]), _raw_tail_blocks(raw_transcript)),
+    )
+
+    _finish_artifacts(
+        artifact_ref,
+        disk_future,
+        entry_id=entry_id,
+        message_dt=message_dt,
+        logical_date=logical_date,
+        raw_transcript=raw_transcript,
+        polished_data=polished_data,
+        title_text=title_text,
+        page_id=page_id,
+        page_url=page_url,
+    )
+
+    _remember_entry(dedupe_key, page_id, page_url, artifact_ref)
+
+    return page_url, artifact_ref, polished_data
+
+
+def _raw_tail_blocks(raw_transcript: str) -> Iterator[dict[str, Any]]:
+    """Blocks for raw-transcript chunks beyond the first (which lives in the Raw property)."""
+
+    blocks = build_notion_blocks(raw_transcript, MAX_CHARS, skip_chunks=1)
+    first = next(blocks, None)
+    if first is None:
+        return
+    yield _heading_block("Raw Transcript (continued)")
+    yield first
+    yield from blocks
+
+
+# ----------------------------------
+# Artifact persistence
+# ----------------------------------
+
+# Default store is a single SQLite database (one row per entry) — thousands
+# of per-entry directories are slow to list and back up. Set
+# LEGACY_FILE_ARTIFACTS=1 to keep writing the journal_entries/<ts>_<id>/
+# directory layout instead (e.g. during migration).
+LEGACY_FILE_ARTIFACTS = os.getenv("LEGACY_FILE_ARTIFACTS") == "1"
+
+JOURNAL_DB_PATH = Path("journal.db")
+
+_journal_db_lock = threading.Lock()
+_journal_db_conn: sqlite3.Connection | None = None
+
+
+def _journal_db() -> sqlite3.Connection:
+    global _journal_db_conn
+    if _journal_db_conn is None:
+        conn = sqlite3.connect(JOURNAL_DB_PATH, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "entry_id TEXT PRIMARY KEY, ts TEXT, journal_date TEXT, "
+            "title TEXT, notion_page_id TEXT, notion_page_url TEXT, "
+            "raw TEXT, polished_json TEXT)"
+        )
+        conn.commit()
+        _journal_db_conn = conn
+    return _journal_db_conn
+
+
+def _store_entry_row(
+    *,
+    entry_id: str,
+    message_dt: datetime,
+    logical_date: date,
+    raw_transcript: str,
+    polished_data: dict[str, str],
+    title_text: str,
+    page_id: str,
+    page_url: str,
+) -> None:
+    with _journal_db_lock:
+        conn = _journal_db()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(entry_id, ts, journal_date, title, notion_page_id, "
+                "notion_page_url, raw, polished_json) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry_id,
+                    message_dt.isoformat(),
+                    logical_date.isoformat(),
+                    title_text,
+                    page_id,
+                    page_url,
+                    raw_transcript,
+                    _dumps_json_bytes(polished_data).decode("utf-8"),
+                ),
+            )
+
+
+def _start_artifacts(
+    entry_id: str,
+    message_dt: datetime,
+    raw_transcript: str,
+    polished_data: dict[str, str],
+):
+    """Kick off the Notion-independent part of artifact persistence.
+
+    In legacy file mode, creates the entry directory and starts the
+    raw/polished writes on the shared pool so they overlap the Notion
+    round-trips. In DB mode there is nothing to do yet — the row is inserted
+    once the page id/url are known. Returns (artifact_ref, future_or_None).
+    """
+
+    if LEGACY_FILE_ARTIFACTS:
+        entry_dir = _prepare_entry_dir(entry_id, message_dt)
+        future = _artifact_executor.submit(
+            _write_entry_files, entry_dir, raw_transcript, polished_data
+        )
+        return str(entry_dir), future
+    return f"journal.db:{entry_id}", None
+
+
+def _finish_artifacts(
+    artifact_ref: str,
+    disk_future,
+    *,
+    entry_id: str,
+    message_dt: datetime,
+    logical_date: date,
+    raw_transcript: str,
+    polished_data: dict[str, str],
+    title_text: str,
+    page_id: str,
+    page_url: str,
+) -> None:
+    """Complete artifact persistence once the Notion page exists."""
+
+    if LEGACY_FILE_ARTIFACTS:
+        disk_future.result()
+        _write_entry_metadata(
+            Path(artifact_ref),
+            entry_id=entry_id,
+            message_dt=message_dt,
+            logical_date=logical_date,
+            title_text=title_text,
+            page_id=page_id,
+            page_url=page_url,
+        )
+    else:
+        _store_entry_row(
+            entry_id=entry_id,
+            message_dt=message_dt,
+            logical_date=logical_date,
+            raw_transcript=raw_transcript,
+            polished_data=polished_data,
+            title_text=title_text,
+            page_id=page_id,
+            page_url=page_url,
+        )
+
+
+def _load_polished(artifact_ref: str) -> dict[str, str]:
+    """Best-effort reload of polished data from either artifact store."""
+
+    if artifact_ref.startswith("journal.db:"):
+        entry_id = artifact_ref.split(":", 1)[1]
+        with _journal_db_lock:
+            row = _journal_db().execute(
+                "SELECT polished_json FROM entries WHERE entry_id = ?",
+                (entry_id,),
+            ).fetchone()
+        if row:
+            try:
+                return _loads_json(row[0])
+            except ValueError:
+                pass
+        return {}
+    try:
+        return _loads_json((Path(artifact_ref) / "polished.json").read_bytes())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _prepare_entry_dir(entry_id: str, message_dt: datetime) -> Path:
+    """Create and return the unique per-entry artifact directory."""
+
     timestamp_str = message_dt.strftime("%Y%m%d_%H%M%S")
     entry_dir = Path("journal_entries") / f"{timestamp_str}_{entry_id}"
     entry_dir.mkdir(parents=True, exist_ok=True)
+    return entry_dir
 
-    # Save raw transcript
-    raw_path = entry_dir / "raw_transcript.txt"
-    raw_path.write_text(raw_transcript, encoding="utf-8")
 
-    # Save polished data
-    polished_path = entry_dir / "polished.json"
-    polished_path.write_text(
-        json.dumps(polished_data, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
+def _write_entry_files(
+    entry_dir: Path, raw_transcript: str, polished_data: dict[str, str]
+) -> None:
+    """Write the raw transcript and polished JSON artifacts.
+
+    Independent of the Notion calls, so callers run this concurrently with
+    the append phase to hide disk latency behind the network round-trips.
+    """
+
+    (entry_dir / "raw_transcript.txt").write_text(raw_transcript, encoding="utf-8")
+    (entry_dir / "polished.json").write_bytes(_dumps_json_bytes(polished_data))
+
+
+def _write_entry_metadata(
+    entry_dir: Path,
+    *,
+    entry_id: str,
+    message_dt: datetime,
+    logical_date: date,
+    title_text: str,
+    page_id: str,
+    page_url: str,
+) -> None:
+    """Write metadata.json (needs the Notion page id/url, so runs last)."""
 
-    # Save metadata
     metadata = {
         "entry_id": entry_id,
         "message_timestamp_utc": message_dt.isoformat(),
@@ -273,10 +901,5 @@ def create_entry_from_memory(
         "notion_page_id": page_id,
         "title": title_text,
     }
-    metadata_path = entry_dir / "metadata.json"
-    metadata_path.write_text(
-        json.dumps(metadata, ensure_ascii=False, indent=2), encoding="utf-8"
-    )
-
-    return page_url, str(entry_dir)
+    (entry_dir / "metadata.json").write_bytes(_dumps_json_bytes(metadata))
 
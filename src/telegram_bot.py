@@ -1,13 +1,19 @@
 import os
 import asyncio
+import atexit
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
+import re
+import time
 from pathlib import Path
 
+import io
+
 # Import pipeline modules
-from src.transcription import transcribe_audio
-from src.llm_polish import process_transcript
-from src.notion_integration import create_entry_from_memory
+from src.transcription import TRANSCRIPT_DIR, transcribe_audio, transcribe_audio_bytes
+from src.llm_polish import process_transcript_stream
+from src.notion_integration import create_entry_from_stream
 
 from dotenv import load_dotenv
 from logging.handlers import RotatingFileHandler
@@ -20,11 +26,24 @@ load_dotenv()
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
 ALLOWED_USERNAME = os.getenv("ALLOWED_USERNAME")
 
+# Parsed once at import: ALLOWED_USERNAME may be a single username/user id or
+# a comma-separated list; None means the bot is open to everyone.
+_ALLOWED = (
+    frozenset(x.strip() for x in (ALLOWED_USERNAME or "").split(",") if x.strip())
+    or None
+)
+
 VOICE_DIR = "voice_messages"
-os.makedirs(VOICE_DIR, exist_ok=True)
+
+# Opt-in archival of the original audio under VOICE_DIR; by default audio is
+# processed in memory and never persisted.
+SAVE_RAW_AUDIO = os.getenv("SAVE_RAW_AUDIO") == "1"
+
+# Whisper rejects uploads over 25MB; anything larger is spilled to disk so we
+# never hold it in memory (it will fail at the API anyway, but cheaply).
+SPILL_THRESHOLD = 25 * 1024 * 1024
 
 LOGS_DIR = "logs"
-os.makedirs(LOGS_DIR, exist_ok=True)
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s | %(levelname)s | %(message)s",
@@ -33,6 +52,7 @@ logging.basicConfig(
             "logs/bot.log",
             maxBytes=10 * 1024 * 1024,  # 10MB per file
             backupCount=5,  # Keep 5 old files
+            delay=True,  # open on first record, after _ensure_dirs() has run
         )
         # No StreamHandler() = no console spam
     ],
@@ -41,15 +61,37 @@ logging.basicConfig(
 # Reduce noise from HTTP client per-request INFO logs (e.g., getUpdates polling)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 
+# Dedicated executor for pipeline work. The event loop's default executor is
+# sized relative to CPU count, which is far more concurrent Whisper/GPT/Notion
+# pipelines than our API quotas can absorb; a small fixed pool caps that and
+# reuses the same threads instead of spawning them per message.
+_PIPELINE_EXEC = ThreadPoolExecutor(
+    max_workers=int(os.getenv("PIPELINE_CONCURRENCY", "3")),
+    thread_name_prefix="pipeline",
+)
+atexit.register(_PIPELINE_EXEC.shutdown, wait=True)
 
-def pipeline_blocking(audio_path: str, message_dt: datetime, user: str) -> str:
+# Caps how many pipelines may be in flight at once — a burst of voice
+# messages queues FIFO behind the semaphore instead of each starting a
+# download-buffer + HTTPS connection immediately.
+PIPELINE_SEM = asyncio.Semaphore(int(os.getenv("MAX_CONCURRENT_PIPELINES", "4")))
+
+# Strong references to in-flight pipeline tasks; asyncio only keeps weak ones,
+# so a fire-and-forget task could otherwise be garbage-collected mid-run.
+_TASKS: set[asyncio.Task] = set()
+
+
+def pipeline_blocking(
+    audio: "str | io.BytesIO", message_dt: datetime, user: str
+) -> str:
     """Execute the journal processing pipeline in a blocking manner.
 
     This function runs the complete pipeline: transcription → polishing → Notion.
     It's designed to run in a thread pool to avoid blocking the async event loop.
 
     Args:
-        audio_path: Path to the downloaded audio file
+        audio: In-memory audio buffer (the common case), or a path to an
+            audio file on disk for oversized messages
         message_dt: Original message timestamp from Telegram
         user: Username or user ID for logging
 
@@ -60,30 +102,48 @@ def pipeline_blocking(audio_path: str, message_dt: datetime, user: str) -> str:
         Exception: Any error during pipeline execution (caller should handle)
     """
     try:
-        logging.info(f"[Pipeline] ({user}) Transcribing…")
-
         # 1. Transcribe audio (in memory)
-        raw_transcript = transcribe_audio(audio_path)
+        start = time.perf_counter()
+        if isinstance(audio, str):
+            raw_transcript = transcribe_audio(audio)
+        else:
+            raw_transcript = transcribe_audio_bytes(audio)
         logging.info(
-            f"[Pipeline] Transcription completed ({len(raw_transcript)} characters)"
+            f"[Pipeline] ({user}) Transcribed {len(raw_transcript)} characters "
+            f"in {(time.perf_counter() - start) * 1000:.0f}ms"
         )
 
-        # 2. Polish + extract keyword (in memory)
-        logging.info("[Pipeline] Polishing transcript & extracting keyword…")
-        polished_data = process_transcript(raw_transcript)
-        logging.info(
-            f"[Pipeline] Polishing completed, title: {polished_data.get('summary', 'Untitled')}"
+        # Persist the raw transcript before the polish/push stages so their
+        # failure can't throw away the Whisper output we already paid for.
+        # Named *_YYYYMMDD_HHMMSS.txt so push_from_files can replay it by hand.
+        os.makedirs(TRANSCRIPT_DIR, exist_ok=True)
+        raw_path = os.path.join(
+            TRANSCRIPT_DIR, f"{user}_{message_dt:%Y%m%d_%H%M%S}.txt"
         )
-
-        # 3. Push to Notion and save artifacts
-        logging.info("[Pipeline] Pushing to Notion and saving artifacts…")
-        notion_url, entry_dir = create_entry_from_memory(
+        Path(raw_path).write_text(raw_transcript, encoding="utf-8")
+
+        # 2+3. Polish and push to Notion, overlapped: the polish response is
+        # streamed and the Notion page is created as soon as the summary
+        # arrives, while the polished text is still being generated.
+        start = time.perf_counter()
+        events = process_transcript_stream(raw_transcript)
+        notion_url, entry_dir, polished_data = create_entry_from_stream(
             raw_transcript=raw_transcript,
-            polished_data=polished_data,
+            events=events,
             message_dt=message_dt,
         )
-        logging.info(f"[Pipeline] Notion page created: {notion_url}")
-        logging.info(f"[Pipeline] Artifacts saved to: {entry_dir}")
+        logging.info(
+            f"[Pipeline] ({user}) Entry saved in "
+            f"{(time.perf_counter() - start) * 1000:.0f}ms — "
+            f"title: {polished_data.get('summary', 'Untitled')!r}, "
+            f"page: {notion_url}, artifacts: {entry_dir}"
+        )
+
+        # Entry is safely in Notion and the artifact store — drop the backup
+        try:
+            os.unlink(raw_path)
+        except FileNotFoundError:
+            pass
 
         return notion_url
 
@@ -96,36 +156,83 @@ def pipeline_blocking(audio_path: str, message_dt: datetime, user: str) -> str:
         # Re-raise the exception so the calling code can handle user notification
         raise
     finally:
-        # Always cleanup: remove original audio file to save space
-        try:
-            if os.path.exists(audio_path):
-                os.remove(audio_path)
-                logging.info(f"[Pipeline] Removed audio file {audio_path}")
-        except OSError as cleanup_exc:
-            logging.warning(
-                f"[Pipeline] Could not delete audio file {audio_path}: {cleanup_exc}"
-            )
+        # Always cleanup: remove original audio file to save space (only
+        # oversized messages ever touch disk; in-memory buffers just get GC'd)
+        if isinstance(audio, str):
+            try:
+                os.unlink(audio)
+                logging.info(f"[Pipeline] Removed audio file {audio}")
+            except FileNotFoundError:
+                pass  # already gone — nothing to clean up
+            except OSError as cleanup_exc:
+                logging.warning(
+                    f"[Pipeline] Could not delete audio file {audio}: {cleanup_exc}"
+                )
+
+
+WELCOME_MESSAGE = """🎙️ **Welcome to your Audio Journal Bot!**
+
+To get started, just send me a voice message.
+
+I will transcribe it, polish the text using AI, and save it directly to your Notion database.
+
+For more details and a list of commands, type /help.
+"""
+
+HELP_MESSAGE = """📚 **Help & Commands**
+
+**How It Works**
+1. 🎤 Send me a voice message.
+2. 🤖 I transcribe it using OpenAI Whisper.
+3. ✨ I polish the text to improve clarity while keeping your original voice.
+4. 📝 The entry is saved to your Notion database, automatically dated (with a 4 AM cutoff).
+5. 📁 All artifacts (raw transcript, polished version, metadata) are archived locally for backup.
+
+**Available Commands**
+• `/start` - Shows the welcome message.
+• `/help` - Shows this detailed help guide.
+
+**Tips**
+• Speak clearly for the best transcription results.
+• Each voice message becomes a single journal entry.
+• Check your Notion database to see your saved entries.
+
+Ready? Just send a voice message! 🚀"""
+
+
+# Error classifier: first pattern that matches the exception text wins.
+# Extending it is a one-line append instead of another elif branch.
+_ERR_TABLE = (
+    (
+        re.compile(r"openai|whisper", re.IGNORECASE),
+        "❌ Failed to transcribe audio. OpenAI/Whisper service may be temporarily unavailable. Please try again later.",
+    ),
+    (
+        re.compile(r"notion", re.IGNORECASE),
+        "❌ Failed to save to Notion. Please check your Notion integration settings and try again.",
+    ),
+    (
+        re.compile(r"json|parse", re.IGNORECASE),
+        "❌ Failed to process transcript. There may be an issue with the AI response format. Please try again.",
+    ),
+    (
+        re.compile(r"file|path", re.IGNORECASE),
+        "❌ Failed to process audio file. The file may be corrupted or in an unsupported format.",
+    ),
+)
 
 
 def get_error_message(exc: Exception) -> str:
     """Generate user-friendly error message based on exception type and content."""
-    error_type = type(exc).__name__
-    exc_str = str(exc).lower()
-
-    if "openai" in exc_str or "whisper" in exc_str:
-        return "❌ Failed to transcribe audio. OpenAI/Whisper service may be temporarily unavailable. Please try again later."
-    elif "notion" in exc_str:
-        return "❌ Failed to save to Notion. Please check your Notion integration settings and try again."
-    elif "json" in exc_str or "parse" in exc_str:
-        return "❌ Failed to process transcript. There may be an issue with the AI response format. Please try again."
-    elif "file" in exc_str or "path" in exc_str:
-        return "❌ Failed to process audio file. The file may be corrupted or in an unsupported format."
-    else:
-        return f"❌ Processing failed due to an unexpected error ({error_type}). Please try again or contact support if the issue persists."
+    exc_str = str(exc)
+    for pattern, message in _ERR_TABLE:
+        if pattern.search(exc_str):
+            return message
+    return f"❌ Processing failed due to an unexpected error ({type(exc).__name__}). Please try again or contact support if the issue persists."
 
 
 async def run_pipeline(
-    audio_path: str,
+    audio: "str | io.BytesIO",
     message_dt: datetime,
     user: str,
     *,
@@ -135,15 +242,17 @@ async def run_pipeline(
     """Execute the journal processing pipeline with comprehensive error handling.
 
     This function orchestrates the pipeline execution in a thread pool and handles
-    user notifications for both success and failure cases.
+    user notifications for both success and failure cases. At most
+    MAX_CONCURRENT_PIPELINES run at once; the rest wait on the semaphore.
     """
     loop = asyncio.get_running_loop()
 
     try:
         # Run pipeline in thread pool to avoid blocking the event loop
-        notion_url = await loop.run_in_executor(
-            None, pipeline_blocking, audio_path, message_dt, user
-        )
+        async with PIPELINE_SEM:
+            notion_url = await loop.run_in_executor(
+                _PIPELINE_EXEC, pipeline_blocking, audio, message_dt, user
+            )
 
         # Notify user of success
         await bot.send_message(
@@ -165,7 +274,7 @@ async def run_pipeline(
 
 
 def is_user_authorized(update: Update) -> bool:
-    return ALLOWED_USERNAME is None or get_user_identifier(update) == ALLOWED_USERNAME
+    return _ALLOWED is None or get_user_identifier(update) in _ALLOWED
 
 
 def get_user_identifier(update: Update) -> str:
@@ -185,17 +294,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         )
         return
     
-    welcome_message = """🎙️ **Welcome to your Audio Journal Bot!**
-
-To get started, just send me a voice message.
-
-I will transcribe it, polish the text using AI, and save it directly to your Notion database.
-
-For more details and a list of commands, type /help.
-"""
-
     await update.message.reply_text(
-        welcome_message,
+        WELCOME_MESSAGE,
         parse_mode=ParseMode.MARKDOWN
     )
 
@@ -208,28 +308,8 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not is_user_authorized(update):
         return
     
-    help_message = """📚 **Help & Commands**
-
-**How It Works**
-1. 🎤 Send me a voice message.
-2. 🤖 I transcribe it using OpenAI Whisper.
-3. ✨ I polish the text to improve clarity while keeping your original voice.
-4. 📝 The entry is saved to your Notion database, automatically dated (with a 4 AM cutoff).
-5. 📁 All artifacts (raw transcript, polished version, metadata) are archived locally for backup.
-
-**Available Commands**
-• `/start` - Shows the welcome message.
-• `/help` - Shows this detailed help guide.
-
-**Tips**
-• Speak clearly for the best transcription results.
-• Each voice message becomes a single journal entry.
-• Check your Notion database to see your saved entries.
-
-Ready? Just send a voice message! 🚀"""
-
     await update.message.reply_text(
-        help_message,
+        HELP_MESSAGE,
         parse_mode=ParseMode.MARKDOWN
     )
 
@@ -246,13 +326,34 @@ async def handle_audio_message(update: Update, context: ContextTypes.DEFAULT_TYP
     file_id = file.file_id
     file_unique_id = file.file_unique_id
     file_ext = "ogg" if update.message.voice else "mp3"
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"{VOICE_DIR}/{user}_{file_unique_id}_{timestamp}.{file_ext}"
+    # Nanosecond stamp in hex: unique even for rapid back-to-back messages,
+    # where a second-resolution strftime stamp could collide.
+    stamp = f"{time.time_ns():x}"
+    filename = f"{VOICE_DIR}/{user}_{file_unique_id}_{stamp}.{file_ext}"
 
-    # Download the audio file
+    # Download the audio into memory; Whisper accepts the buffer directly, so
+    # the common case never touches disk. Oversized files are spilled instead.
     tg_file = await context.bot.get_file(file_id)
-    await tg_file.download_to_drive(filename)
-    logging.info(f"Saved audio message from {user} → {filename}")
+    bio = io.BytesIO()
+    await tg_file.download_to_memory(out=bio)
+    size = bio.getbuffer().nbytes
+    if size > SPILL_THRESHOLD:
+        with open(filename, "wb") as f:
+            f.write(bio.getbuffer())
+        audio: "str | io.BytesIO" = filename
+        logging.info(f"Saved oversized audio message from {user} → {filename}")
+    else:
+        bio.name = filename  # the OpenAI SDK sniffs the format from the name
+        audio = bio
+        logging.info(
+            f"Downloaded audio message from {user} ({size} bytes, in memory)"
+        )
+        if SAVE_RAW_AUDIO:
+            # Archival copy; the pipeline's cleanup only removes spilled
+            # files, so this one is kept.
+            with open(filename, "wb") as f:
+                f.write(bio.getbuffer())
+            logging.info(f"Archived audio message → {filename}")
 
     # Inform user that processing has started
     await context.bot.send_message(
@@ -260,20 +361,33 @@ async def handle_audio_message(update: Update, context: ContextTypes.DEFAULT_TYP
     )
 
     # Freeing up the event loop to handle other messages (telegam lib requirement)
-    asyncio.create_task(
+    task = asyncio.create_task(
         run_pipeline(
-            filename,
+            audio,
             update.message.date,
             user,
             chat_id=update.effective_chat.id,
             bot=context.bot,
         )
     )
+    _TASKS.add(task)
+    task.add_done_callback(_TASKS.discard)
+
+
+def _ensure_dirs() -> None:
+    """Create the bot's working directories once at startup.
+
+    Done here rather than at import time so merely importing the module
+    (tests, tooling) doesn't touch the filesystem.
+    """
+    for d in (VOICE_DIR, LOGS_DIR):
+        os.makedirs(d, exist_ok=True)
 
 
 def main() -> None:
     """Initialize and start the Telegram bot (blocking call)."""
 
+    _ensure_dirs()
     application = Application.builder().token(TELEGRAM_BOT_TOKEN).build()
 
     application.add_handler(CommandHandler("start", start_command))
@@ -1,20 +1,27 @@
 from __future__ import annotations
 
-from typing import List
+import re
+from typing import Iterator, List, Tuple
 
-__all__ = ["chunk_text"]
+__all__ = ["chunk_text", "iter_chunks"]
 
+# Last space/tab/newline in a window, found in one right-anchored C-level scan
+# (match the break char, then only non-break chars up to the window end).
+_LAST_BREAK = re.compile(r"[ \t\n][^ \t\n]*\Z")
+_LAST_BREAK_B = re.compile(rb"[ \t\n][^ \t\n]*\Z")
 
-def chunk_text(text: str, max_chars: int = 2000) -> List[str]:
-    """Split *text* into chunks no longer than *max_chars*, preferring word boundaries.
+# Bytes that str.isspace() considers whitespace in the ASCII range (this is a
+# superset of bytes.isspace(), which lacks the \x1c-\x1f separators).
+_ASCII_WS = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
 
-    • Whitespace (space, tab, newline, etc.) is used as the preferred break point.
-    • The original spacing and line-breaks inside each chunk are preserved – we slice
-      the *original string* rather than re-joining tokens.
-    • If no whitespace is found within a *max_chars* window, the text will be
-      hard-truncated at the character limit to ensure all chunks stay ≤ *max_chars*.
-      This handles edge cases like very long URLs or words while maintaining strict
-      size limits required by APIs like Notion.
+
+def iter_chunks(text: str, max_chars: int = 2000) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, end)`` offset pairs for the chunks of *text*.
+
+    Same splitting rules as :func:`chunk_text`, but yields slice boundaries
+    instead of materialised substrings — callers that stream chunks (e.g.
+    straight into Notion blocks) slice only what they consume, so the source
+    text is never duplicated wholesale.
     """
 
     if max_chars <= 0:
@@ -22,41 +29,89 @@ def chunk_text(text: str, max_chars: int = 2000) -> List[str]:
 
     length = len(text)
     if length == 0:
-        return []
+        return
+    # Fast path: the vast majority of inputs fit in a single chunk.
+    if length <= max_chars:
+        yield (0, length)
+        return
 
-    chunks: List[str] = []
-    start = 0
+    # ASCII fast path (common for polished English transcripts): byte and
+    # code-point offsets coincide, so the loop can run entirely on bytes and
+    # skip per-character Unicode dispatch.
+    if text.isascii():
+        yield from _iter_byte_spans(text.encode("ascii"), max_chars)
+        return
 
+    start = 0
     while start < length:
         # Naïvely take a slice of max_chars
         end = min(start + max_chars, length)
 
-        # If we've reached the end of the text, append and break
+        # If we've reached the end of the text, yield the remainder and stop
         if end == length:
-            chunks.append(text[start:end])
+            yield (start, end)
             break
 
         # If the char right at the boundary is whitespace, perfect split
         if text[end].isspace():
-            chunks.append(text[start:end])
+            yield (start, end)
             start = end + 1  # skip the whitespace char itself
             continue
 
         # Otherwise back-track to the last whitespace within the window
-        last_space = text.rfind(" ", start, end)
-        last_space_tab = text.rfind("\t", start, end)
-        last_space_nl = text.rfind("\n", start, end)
-        last_break = max(last_space, last_space_tab, last_space_nl)
+        match = _LAST_BREAK.search(text, start, end)
+        last_break = match.start() if match is not None else -1
 
         if last_break == -1 or last_break <= start:
             # No whitespace within the window – the word itself is > max_chars.
             # Slice at the hard limit even though it breaks the word. This keeps
             # every chunk ≤ max_chars, which is required by Notion.
-            chunks.append(text[start:end])
+            yield (start, end)
             start = end
         else:
             # Cut at the last whitespace (include it) so we preserve spacing
-            chunks.append(text[start : last_break + 1])
+            yield (start, last_break + 1)
             start = last_break + 1  # next chunk starts after the whitespace char
 
-    return chunks
+
+def _iter_byte_spans(data: bytes, max_chars: int) -> Iterator[Tuple[int, int]]:
+    """ASCII variant of the span loop; mirrors iter_chunks exactly."""
+
+    length = len(data)
+    start = 0
+    while start < length:
+        end = min(start + max_chars, length)
+
+        if end == length:
+            yield (start, end)
+            break
+
+        if data[end] in _ASCII_WS:
+            yield (start, end)
+            start = end + 1
+            continue
+
+        match = _LAST_BREAK_B.search(data, start, end)
+        last_break = match.start() if match is not None else -1
+
+        if last_break == -1 or last_break <= start:
+            yield (start, end)
+            start = end
+        else:
+            yield (start, last_break + 1)
+            start = last_break + 1
+
+
+def chunk_text(text: str, max_chars: int = 2000) -> List[str]:
+    """Split *text* into chunks no longer than *max_chars*, preferring word boundaries.
+
+    • Whitespace (space, tab, newline, etc.) is used as the preferred break point.
+    • The original spacing and line-breaks inside each chunk are preserved – we slice
+      the *original string* rather than re-joining tokens.
+    • If no whitespace is found within a *max_chars* window, the text will be
+      hard-truncated at the character limit to ensure all chunks stay ≤ *max_chars*.
+      This handles edge cases like very long URLs or words while maintaining strict
+      size limits required by APIs like Notion.
+    """
+
+    return [text[start:end] for start, end in iter_chunks(text, max_chars)]
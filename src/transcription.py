@@ -1,21 +1,31 @@
 from __future__ import annotations
 
+import io
 import os
 from typing import Optional
 
 from openai import OpenAI
 from dotenv import load_dotenv
 
+from src.http_client import new_http_client
+
 # Load environment variables from a .env file if present (consistent with other modules)
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
-client = OpenAI(api_key=OPENAI_API_KEY)
+# Optional fixed transcription language (e.g. "en", "ru"). When set, Whisper
+# skips its language auto-detection pass over the first 30s of audio — for a
+# single-user bot the journal language is usually known.
+WHISPER_LANGUAGE = os.getenv("WHISPER_LANGUAGE")
+
+# max_retries=4: transient 429/5xx/connection errors are retried by the SDK
+# with exponential backoff instead of aborting the whole pipeline.
+client = OpenAI(api_key=OPENAI_API_KEY, http_client=new_http_client(), max_retries=4)
 
 # Directory where plain-text transcripts are stored when the script is invoked
-# with the --save flag.
+# with the --save flag. Created lazily in transcribe_and_save so importing the
+# module doesn't touch the filesystem.
 TRANSCRIPT_DIR = "transcripts"
-os.makedirs(TRANSCRIPT_DIR, exist_ok=True)
 
 
 def transcribe_audio(
@@ -30,6 +40,7 @@ def transcribe_audio(
         file_path: Path to the audio file (mp3, ogg, wav, m4a, etc.).
         model: Whisper model identifier. Defaults to ``"whisper-1"``.
         language: Optional BCP-47 language tag to bias transcription (e.g. ``"en"``).
+            Falls back to the ``WHISPER_LANGUAGE`` env var when not given.
 
     Returns:
         The transcribed text.
@@ -42,6 +53,11 @@ def transcribe_audio(
     if not os.path.isfile(file_path):
         raise FileNotFoundError(f"Audio file not found: {file_path}")
 
+    language = language or WHISPER_LANGUAGE
+
+    # The SDK hands the open file object straight to httpx, whose multipart
+    # encoder streams it from disk in fixed-size chunks — the upload never
+    # buffers the whole file in memory.
     with open(file_path, "rb") as audio_file:
         response = client.audio.transcriptions.create(
             model=model,
@@ -58,6 +74,42 @@ def transcribe_audio(
     return text
 
 
+def transcribe_audio_bytes(
+    audio: io.BytesIO,
+    *,
+    model: str = "whisper-1",
+    language: Optional[str] = None,
+) -> str:
+    """Transcribe in-memory audio via OpenAI Whisper.
+
+    Like :func:`transcribe_audio`, but takes an in-memory buffer instead of a
+    file path, avoiding a round-trip through the filesystem. The buffer's
+    ``name`` attribute must be set to a filename with the right extension
+    (e.g. ``"voice.ogg"``) — the SDK uses it to detect the audio format.
+    The language falls back to the ``WHISPER_LANGUAGE`` env var when not given.
+
+    Returns:
+        The transcribed text.
+
+    Raises:
+        RuntimeError: If the OpenAI API fails or the response is malformed.
+    """
+
+    language = language or WHISPER_LANGUAGE
+    audio.seek(0)
+    response = client.audio.transcriptions.create(
+        model=model,
+        file=audio,
+        language=language,
+    )
+
+    text: Optional[str] = getattr(response, "text", None)
+    if text is None:
+        raise RuntimeError("Unexpected OpenAI response: missing 'text' attribute")
+
+    return text
+
+
 def transcribe_and_save(
     file_path: str,
     *,
@@ -75,6 +127,7 @@ def transcribe_and_save(
     transcript = transcribe_audio(file_path, model=model, language=language)
 
     if output_path is None:
+        os.makedirs(TRANSCRIPT_DIR, exist_ok=True)
         base = os.path.splitext(os.path.basename(file_path))[0] + ".txt"
         output_path = os.path.join(TRANSCRIPT_DIR, base)
 
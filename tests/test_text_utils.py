@@ -1,6 +1,13 @@
 import unittest
 
-from src.text_utils import chunk_text
+from src.text_utils import chunk_text, iter_chunks
+
+
+class _ForceStrPath(str):
+    """String that reports non-ASCII, forcing iter_chunks onto the str loop."""
+
+    def isascii(self):
+        return False
 
 
 class ChunkTextTests(unittest.TestCase):
@@ -17,6 +24,10 @@ class ChunkTextTests(unittest.TestCase):
         for chunk in chunks:
             self.assertLessEqual(len(chunk), 2000)
 
+    def test_short_text_single_chunk(self):
+        text = "short entry that fits in one chunk"
+        self.assertEqual(chunk_text(text, max_chars=2000), [text])
+
     def test_no_word_split(self):
         long_word = "a" * 1990 + " " + "b" * 20
         chunks = chunk_text(long_word, max_chars=2000)
@@ -27,5 +38,48 @@ class ChunkTextTests(unittest.TestCase):
         self.assertEqual("".join(chunks), long_word)
 
 
+class IterChunksTests(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(list(iter_chunks("")), [])
+
+    def test_spans_match_chunk_text(self):
+        for text in ["short", ("hello world " * 50).strip(), "a" * 95]:
+            for max_chars in (7, 40, 2000):
+                spans = list(iter_chunks(text, max_chars))
+                self.assertEqual(
+                    [text[s:e] for s, e in spans], chunk_text(text, max_chars)
+                )
+
+    def test_spans_are_ordered_and_bounded(self):
+        text = "word " * 200 + "tail"
+        prev_end = 0
+        for start, end in iter_chunks(text, 33):
+            self.assertGreaterEqual(start, prev_end)
+            self.assertLess(start, end)
+            self.assertLessEqual(end - start, 33)
+            prev_end = end
+        self.assertEqual(prev_end, len(text))
+
+    def test_ascii_and_str_paths_agree(self):
+        # The ASCII bytes loop must stay byte-for-byte equivalent to the str
+        # loop, including the whitespace bytes where bytes.isspace and
+        # str.isspace differ (\r, \x0b, \x0c and the \x1c-\x1f separators).
+        texts = [
+            "plain words separated by spaces only, repeated a bit " * 4,
+            "tabs\tand\nnewlines\rand\x0bodd\x0cwhitespace " * 6,
+            "unit\x1cseparators\x1deverywhere\x1ehere\x1ftoo " * 6,
+            "word " * 30 + "x\x1c" + "y" * 40,
+            "a" * 50,  # no whitespace at all — hard splits
+        ]
+        for text in texts:
+            self.assertTrue(text.isascii())
+            for max_chars in (5, 12, 31):
+                self.assertEqual(
+                    list(iter_chunks(text, max_chars)),
+                    list(iter_chunks(_ForceStrPath(text), max_chars)),
+                    f"paths diverge for {text!r} at max_chars={max_chars}",
+                )
+
+
 if __name__ == "__main__":
     unittest.main()